@@ -1,12 +1,271 @@
 # financial_calculator.py
 # Um módulo para cálculos financeiros básicos
 
+import math
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    from numba.experimental import jitclass
+    _HAS_NUMBA = True
+except ImportError:
+    # Numba é opcional: sem ele os kernels rodam como Python puro
+    _HAS_NUMBA = False
+    prange = range
+    
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+    
+    def jitclass(cls):
+        return cls
+
+
+@njit(cache=True)
+def _pmt_kernel(r, n, L):
+    """
+    Kernel numérico da parcela mensal (sistema Price).
+    
+    Args:
+        r (float): Taxa de juros mensal (decimal)
+        n (int): Número de parcelas
+        L (float): Valor do empréstimo
+    
+    Returns:
+        float: Valor da parcela mensal
+    """
+    if r == 0.0:
+        return L / n
+    c_minus_1 = math.expm1(n * math.log1p(r))
+    return L * r * (c_minus_1 + 1.0) / c_minus_1
+
+
+def _pmt_from_growth(r, n, L, growth_minus_one):
+    """
+    Calcula a parcela mensal a partir de (1 + r)^n - 1 já calculado.
+    
+    Args:
+        r (float): Taxa de juros mensal (decimal)
+        n (int): Número de parcelas
+        L (float): Valor do empréstimo
+        growth_minus_one (float): (1 + r)^n - 1
+    
+    Returns:
+        float: Valor da parcela mensal
+    """
+    if r == 0.0:
+        return L / n
+    return L * r * (growth_minus_one + 1.0) / growth_minus_one
+
+
+@njit(cache=True)
+def _pmt_batch_kernel(r, n, L):
+    """
+    Versão de _pmt_kernel para arrays de empréstimos.
+    
+    A taxa zero é tratada com np.where em vez de um desvio por empréstimo,
+    para que o cálculo continue vetorizável em varreduras de taxas.
+    
+    Args:
+        r (ndarray): Taxas de juros mensais (decimal)
+        n (ndarray): Números de parcelas
+        L (ndarray): Valores dos empréstimos
+    
+    Returns:
+        ndarray: Valores das parcelas mensais
+    """
+    # Taxa mínima positiva evita 0/0 no lado descartado pelo np.where
+    r_safe = np.maximum(r, 1e-300)
+    c_minus_1 = np.expm1(n * np.log1p(r_safe))
+    return np.where(r == 0.0, L / n, L * r_safe * (c_minus_1 + 1.0) / c_minus_1)
+
+
+def _loan_terms(interest_rate, loan_term_years):
+    """
+    Valida taxa e prazo de um empréstimo e os converte para a base mensal.
+    
+    Args:
+        interest_rate (float): Taxa de juros anual (em percentual, ex: 5.5 para 5.5%)
+        loan_term_years (int): Prazo do empréstimo em anos
+    
+    Returns:
+        tuple: Taxa de juros mensal (decimal) e número de parcelas
+    
+    Raises:
+        ValueError: Se a taxa de juros for negativa ou o prazo for menor ou igual a zero
+    """
+    if interest_rate < 0:
+        raise ValueError("A taxa de juros não pode ser negativa")
+    if loan_term_years <= 0:
+        raise ValueError("O prazo do empréstimo deve ser maior que zero")
+    
+    return interest_rate / 100 / 12, loan_term_years * 12
+
+
+def _schedule_columns(r, n, L, payment, growth_minus_one):
+    """
+    Calcula as colunas da tabela de amortização pela forma fechada do saldo devedor.
+    
+    Args:
+        r (float): Taxa de juros mensal (decimal)
+        n (int): Número de parcelas
+        L (float): Valor do empréstimo
+        payment (float): Valor da parcela mensal
+        growth_minus_one (float): (1 + r)^n - 1
+    
+    Returns:
+        tuple: Três arrays (principal, interest, balances), sem arredondamento
+    """
+    months = np.arange(1, n + 1)
+    
+    # Saldo devedor de todos os meses de uma vez, na forma
+    # B_k = B_0 * (1 + r)^k * ((1 + r)^(n - k) - 1) / ((1 + r)^n - 1),
+    # que não subtrai termos grandes e quase iguais e zera exatamente no mês n
+    if r == 0.0:
+        balances = L * (n - months) / n
+    else:
+        # (1 + r)^j - 1 para j = 0..n, de uma vez; o mesmo array fornece
+        # (1 + r)^k e, lido de trás para frente, (1 + r)^(n - k) - 1
+        powers_minus_one = np.expm1(np.arange(n + 1) * math.log1p(r))
+        powers_minus_one[-1] = growth_minus_one
+        growth = powers_minus_one[1:] + 1.0
+        remaining_growth_minus_one = powers_minus_one[-2::-1]
+        balances = L * growth * remaining_growth_minus_one / growth_minus_one
+    
+    interest = np.empty_like(balances)
+    interest[0] = L * r
+    interest[1:] = balances[:-1] * r
+    principal = payment - interest
+    
+    return principal, interest, balances
+
+
+# Cópias compiladas para o LoanCalculatorCore. O LoanCalculator usa as versões
+# acima em Python/NumPy puro: sem compilação na primeira chamada e com os
+# TypeError/ValueError de sempre para argumentos inválidos
+_loan_terms_jit = njit(cache=True)(_loan_terms)
+_pmt_from_growth_jit = njit(cache=True)(_pmt_from_growth)
+_schedule_columns_jit = njit(cache=True)(_schedule_columns)
+
+
+@njit(cache=True)
+def _amortize_kernel(r, n, L, payment, out_payment, out_principal, out_interest, out_balance):
+    """
+    Kernel da tabela de amortização de um único empréstimo.
+    
+    O saldo devedor é atualizado mês a mês com soma compensada (Kahan), de
+    modo que o erro de arredondamento não se acumula ao longo das parcelas e
+    o saldo final fica a poucos ULPs de zero; ele é então fixado em zero.
+    Posições além de n nas saídas são zeradas.
+    
+    Args:
+        r (float): Taxa de juros mensal (decimal)
+        n (int): Número de parcelas
+        L (float): Valor do empréstimo
+        payment (float): Valor da parcela mensal
+        out_payment, out_principal, out_interest, out_balance (ndarray): Colunas de saída
+    """
+    balance = L
+    compensation = 0.0
+    
+    for k in range(out_balance.shape[0]):
+        if k >= n:
+            out_payment[k] = 0.0
+            out_principal[k] = 0.0
+            out_interest[k] = 0.0
+            out_balance[k] = 0.0
+            continue
+        
+        interest = balance * r
+        principal = payment - interest
+        
+        y = -principal - compensation
+        t = balance + y
+        compensation = (t - balance) - y
+        balance = t
+        
+        # O saldo final é zero por definição; o resíduo de arredondamento é descartado
+        if k == n - 1:
+            balance = 0.0
+        
+        out_payment[k] = payment
+        out_principal[k] = principal
+        out_interest[k] = interest
+        out_balance[k] = balance
+
+
+try:
+    # Kernels compilados antecipadamente, se disponíveis (ver build_kernels.py)
+    import _finance_kernels
+except ImportError:
+    _finance_kernels = None
+
+if _finance_kernels is not None:
+    # O LoanCalculator chama estes direto do Python, então usa as versões AOT
+    # mesmo com o Numba instalado: sem compilação nem carga de cache do JIT
+    _pmt_from_growth = _finance_kernels.pmt_from_growth
+    _schedule_columns = _finance_kernels.schedule_columns
+
+if not _HAS_NUMBA:
+    # Os demais só substituem os kernels @njit na falta do Numba, pois
+    # funções AOT não podem ser chamadas de dentro de _amortize_batch_kernel
+    if _finance_kernels is not None:
+        _amortize_kernel = _finance_kernels.amortize
+        _pmt_kernel = _finance_kernels.pmt
+        _pmt_batch_kernel = _finance_kernels.pmt_batch
+    else:
+        try:
+            # ou o mesmo kernel compilado com Cython (ver _amort.pyx)
+            from _amort import amortize as _amortize_kernel
+        except ImportError:
+            pass
+
+
+@njit(cache=True, parallel=True)
+def _amortize_batch_kernel(rates, terms, amounts, out_payment, out_principal, out_interest, out_balance):
+    """
+    Aplica _amortize_kernel a cada empréstimo, distribuindo os empréstimos entre os núcleos.
+    """
+    payments = _pmt_batch_kernel(rates, terms, amounts)
+    
+    for i in prange(rates.shape[0]):
+        _amortize_kernel(rates[i], terms[i], amounts[i], payments[i],
+                         out_payment[i], out_principal[i], out_interest[i], out_balance[i])
+
+
+# Layout de cada linha da tabela de amortização (uma coluna contígua por campo).
+# Os valores monetários são guardados em centavos inteiros, o que torna somas exatas.
+SCHEDULE_DTYPE = np.dtype([
+    ('payment_number', 'i4'),
+    ('payment_amount', 'i8'),
+    ('principal_paid', 'i8'),
+    ('interest_paid', 'i8'),
+    ('remaining_balance', 'i8')
+])
+
+
+# Resultado de LoanCalculator.analyze
+LoanAnalysis = namedtuple('LoanAnalysis', ['monthly_payment', 'total_interest', 'schedule'])
+
+
 class LoanCalculator:
     """
     Classe para cálculos relacionados a empréstimos e financiamentos.
     Fornece métodos para calcular parcelas, juros e amortização.
     """
     
+    __slots__ = (
+        'annual_interest_rate',
+        'loan_term_years',
+        'monthly_interest_rate',
+        'loan_term_months',
+        '_growth_minus_one'
+    )
+    
     def __init__(self, interest_rate, loan_term_years):
         """
         Inicializa um calculador de empréstimos.
@@ -18,15 +277,18 @@ class LoanCalculator:
         Raises:
             ValueError: Se a taxa de juros for negativa ou o prazo for menor ou igual a zero
         """
-        if interest_rate < 0:
-            raise ValueError("A taxa de juros não pode ser negativa")
-        if loan_term_years <= 0:
-            raise ValueError("O prazo do empréstimo deve ser maior que zero")
-            
+        self.monthly_interest_rate, self.loan_term_months = _loan_terms(interest_rate, loan_term_years)
         self.annual_interest_rate = interest_rate
         self.loan_term_years = loan_term_years
-        self.monthly_interest_rate = interest_rate / 100 / 12
-        self.loan_term_months = loan_term_years * 12
+        
+        # (1 + r)^n - 1 depende apenas da taxa e do prazo, então é calculado uma única vez
+        self._growth_minus_one = math.expm1(self.loan_term_months * math.log1p(self.monthly_interest_rate))
+    
+    def _pmt(self, loan_amount):
+        """
+        Calcula a parcela mensal sem validar os argumentos, reaproveitando (1 + r)^n - 1.
+        """
+        return _pmt_from_growth(self.monthly_interest_rate, self.loan_term_months, loan_amount, self._growth_minus_one)
     
     def calculate_monthly_payment(self, loan_amount):
         """
@@ -44,20 +306,16 @@ class LoanCalculator:
         if loan_amount <= 0:
             raise ValueError("O valor do empréstimo deve ser maior que zero")
             
-        if self.monthly_interest_rate == 0:
-            return loan_amount / self.loan_term_months
-            
-        numerator = loan_amount * self.monthly_interest_rate * (1 + self.monthly_interest_rate) ** self.loan_term_months
-        denominator = (1 + self.monthly_interest_rate) ** self.loan_term_months - 1
-        
-        return numerator / denominator
+        return self._pmt(loan_amount)
     
-    def generate_amortization_schedule(self, loan_amount):
+    def generate_amortization_schedule(self, loan_amount, as_array=False):
         """
         Gera uma tabela de amortização para o empréstimo.
         
         Args:
             loan_amount (float): Valor total do empréstimo
+            as_array (bool): Se True, retorna um array estruturado do NumPy
+                             (dtype SCHEDULE_DTYPE) em vez da lista de dicionários
             
         Returns:
             list: Lista de dicionários com detalhes de cada pagamento mensal
@@ -67,6 +325,8 @@ class LoanCalculator:
                  - principal_paid (float)
                  - interest_paid (float)
                  - remaining_balance (float)
+            numpy.ndarray: Array estruturado com os mesmos campos, se as_array for True,
+                 com os valores monetários em centavos (int)
                  
         Raises:
             ValueError: Se o valor do empréstimo for menor ou igual a zero
@@ -74,36 +334,31 @@ class LoanCalculator:
         if loan_amount <= 0:
             raise ValueError("O valor do empréstimo deve ser maior que zero")
         
-        monthly_payment = self.calculate_monthly_payment(loan_amount)
-        remaining_balance = loan_amount
-        schedule = []
+        return self._schedule(loan_amount, self._pmt(loan_amount), as_array)
+    
+    def _schedule(self, loan_amount, monthly_payment, as_array):
+        """
+        Monta a tabela de amortização a partir de uma parcela já calculada, sem validar os argumentos.
+        """
+        principal, interest, balances = _schedule_columns(
+            self.monthly_interest_rate, self.loan_term_months, loan_amount, monthly_payment,
+            self._growth_minus_one
+        )
         
-        for month in range(1, self.loan_term_months + 1):
-            interest_payment = remaining_balance * self.monthly_interest_rate
-            principal_payment = monthly_payment - interest_payment
-            
-            # Ajuste para o último pagamento (para evitar imprecisões de ponto flutuante)
-            if month == self.loan_term_months:
-                principal_payment = remaining_balance
-                monthly_payment = principal_payment + interest_payment
-            
-            remaining_balance -= principal_payment
-            
-            # Para evitar valores de saldo negativos muito pequenos devido a erro de arredondamento
-            if abs(remaining_balance) < 0.01:
-                remaining_balance = 0
-            
-            payment_details = {
-                'payment_number': month,
-                'payment_amount': round(monthly_payment, 2),
-                'principal_paid': round(principal_payment, 2),
-                'interest_paid': round(interest_payment, 2),
-                'remaining_balance': round(remaining_balance, 2)
-            }
-            
-            schedule.append(payment_details)
+        schedule = np.empty(self.loan_term_months, dtype=SCHEDULE_DTYPE)
+        schedule['payment_number'] = np.arange(1, self.loan_term_months + 1)
+        schedule['payment_amount'] = np.rint(monthly_payment * 100)
+        schedule['principal_paid'] = np.rint(principal * 100)
+        schedule['interest_paid'] = np.rint(interest * 100)
+        schedule['remaining_balance'] = np.rint(balances * 100)
         
-        return schedule
+        if as_array:
+            return schedule
+        
+        amounts = [(schedule[name] / 100).tolist() for name in SCHEDULE_DTYPE.names[1:]]
+        rows = zip(schedule['payment_number'].tolist(), *amounts)
+        
+        return [dict(zip(SCHEDULE_DTYPE.names, row)) for row in rows]
     
     def calculate_total_interest(self, loan_amount):
         """
@@ -121,11 +376,37 @@ class LoanCalculator:
         if loan_amount <= 0:
             raise ValueError("O valor do empréstimo deve ser maior que zero")
             
-        monthly_payment = self.calculate_monthly_payment(loan_amount)
+        monthly_payment = self._pmt(loan_amount)
         total_payment = monthly_payment * self.loan_term_months
         
         return total_payment - loan_amount
     
+    def analyze(self, loan_amount, as_array=False):
+        """
+        Calcula parcela, total de juros e tabela de amortização em uma única chamada.
+        
+        Equivale a chamar calculate_monthly_payment, calculate_total_interest e
+        generate_amortization_schedule, mas valida o valor e calcula a parcela uma só vez.
+        
+        Args:
+            loan_amount (float): Valor total do empréstimo
+            as_array (bool): Formato da tabela, como em generate_amortization_schedule
+            
+        Returns:
+            LoanAnalysis: Tupla nomeada com monthly_payment, total_interest e schedule
+            
+        Raises:
+            ValueError: Se o valor do empréstimo for menor ou igual a zero
+        """
+        if loan_amount <= 0:
+            raise ValueError("O valor do empréstimo deve ser maior que zero")
+        
+        monthly_payment = self._pmt(loan_amount)
+        total_interest = monthly_payment * self.loan_term_months - loan_amount
+        schedule = self._schedule(loan_amount, monthly_payment, as_array)
+        
+        return LoanAnalysis(monthly_payment, total_interest, schedule)
+    
     def calculate_loan_to_value_ratio(self, loan_amount, property_value):
         """
         Calcula a relação entre o valor do empréstimo e o valor do imóvel (LTV).
@@ -148,6 +429,143 @@ class LoanCalculator:
         return (loan_amount / property_value) * 100
 
 
+@jitclass
+class LoanCalculatorCore:
+    """
+    Versão compilada (jitclass do Numba) dos cálculos do LoanCalculator.
+    
+    Pode ser criada e usada dentro de funções @njit, por exemplo em laços de
+    simulação de cenários. Usa cópias compiladas das mesmas funções do
+    LoanCalculator, então os resultados coincidem; como o Numba não compila
+    dicionários, a tabela de amortização é retornada como colunas NumPy sem
+    arredondamento.
+    Sem Numba, funciona como uma classe Python comum.
+    """
+    annual_interest_rate: float
+    loan_term_years: int
+    monthly_interest_rate: float
+    loan_term_months: int
+    _growth_minus_one: float
+    
+    def __init__(self, interest_rate, loan_term_years):
+        """
+        Inicializa o núcleo compilado de um calculador de empréstimos.
+        
+        Args:
+            interest_rate (float): Taxa de juros anual (em percentual, ex: 5.5 para 5.5%)
+            loan_term_years (int): Prazo do empréstimo em anos
+        
+        Raises:
+            ValueError: Se a taxa de juros for negativa ou o prazo for menor ou igual a zero
+        """
+        self.monthly_interest_rate, self.loan_term_months = _loan_terms_jit(interest_rate, loan_term_years)
+        self.annual_interest_rate = interest_rate
+        self.loan_term_years = loan_term_years
+        
+        # (1 + r)^n - 1 depende apenas da taxa e do prazo, então é calculado uma única vez
+        self._growth_minus_one = math.expm1(self.loan_term_months * math.log1p(self.monthly_interest_rate))
+    
+    def calculate_monthly_payment(self, loan_amount):
+        """
+        Calcula o valor da parcela mensal para um empréstimo.
+        
+        Args:
+            loan_amount (float): Valor total do empréstimo
+            
+        Returns:
+            float: Valor da parcela mensal
+            
+        Raises:
+            ValueError: Se o valor do empréstimo for menor ou igual a zero
+        """
+        if loan_amount <= 0:
+            raise ValueError("O valor do empréstimo deve ser maior que zero")
+        
+        return _pmt_from_growth_jit(
+            self.monthly_interest_rate, self.loan_term_months, loan_amount, self._growth_minus_one
+        )
+    
+    def calculate_total_interest(self, loan_amount):
+        """
+        Calcula o total de juros pagos durante todo o empréstimo.
+        
+        Args:
+            loan_amount (float): Valor total do empréstimo
+            
+        Returns:
+            float: Total de juros pagos
+            
+        Raises:
+            ValueError: Se o valor do empréstimo for menor ou igual a zero
+        """
+        return self.calculate_monthly_payment(loan_amount) * self.loan_term_months - loan_amount
+    
+    def generate_amortization_schedule(self, loan_amount):
+        """
+        Gera a tabela de amortização do empréstimo em colunas.
+        
+        Args:
+            loan_amount (float): Valor total do empréstimo
+            
+        Returns:
+            tuple: Quatro arrays (payments, principal, interest, balances) com um
+                   elemento por mês, sem arredondamento
+            
+        Raises:
+            ValueError: Se o valor do empréstimo for menor ou igual a zero
+        """
+        payment = self.calculate_monthly_payment(loan_amount)
+        principal, interest, balances = _schedule_columns_jit(
+            self.monthly_interest_rate, self.loan_term_months, loan_amount, payment,
+            self._growth_minus_one
+        )
+        
+        return np.full(self.loan_term_months, payment), principal, interest, balances
+
+
+# Número de períodos de capitalização por ano
+_FREQUENCY_MAP = {
+    "annual": 1,
+    "semiannual": 2,
+    "quarterly": 4,
+    "monthly": 12,
+    "daily": 365
+}
+
+_INVALID_FREQUENCY_MESSAGE = (
+    "Frequência de capitalização inválida. Deve ser uma das seguintes: " + ", ".join(_FREQUENCY_MAP)
+)
+
+
+# Os núcleos abaixo são memoizados: cenários repetidos (backtests, redesenho de
+# gráficos) não recalculam o resultado. A chave é o valor exato dos argumentos,
+# então valores com precisão excessiva (ex: 1000.0000001) não aproveitam o cache;
+# arredonde para centavos antes de chamar as funções públicas.
+@lru_cache(maxsize=8192)
+def _future_value_core(principal, rate, time_years, n):
+    """
+    Calcula o valor futuro com n capitalizações por ano, sem validar os argumentos.
+    """
+    # Converter taxa percentual para decimal
+    rate_decimal = rate / 100
+    
+    # Calcular o valor futuro usando a fórmula de juros compostos
+    # (1 + i)^t calculado como exp(t * log1p(i)) para não perder precisão com i pequeno
+    return principal * math.exp(n * time_years * math.log1p(rate_decimal / n))
+
+
+@lru_cache(maxsize=8192)
+def _inflation_adjusted_core(present_value, inflation_rate, years):
+    """
+    Calcula o valor ajustado pela inflação, sem validar os argumentos.
+    """
+    # Converter taxa percentual para decimal
+    inflation_decimal = inflation_rate / 100
+    
+    # Calcular o valor ajustado pela inflação
+    return present_value * math.exp(-years * math.log1p(inflation_decimal))
+
+
 def calculate_future_value(principal, rate, time_years, compounding_frequency="annual"):
     """
     Calcula o valor futuro de um investimento com juros compostos.
@@ -173,28 +591,11 @@ def calculate_future_value(principal, rate, time_years, compounding_frequency="a
     if time_years < 0:
         raise ValueError("O tempo não pode ser negativo")
     
-    # Converter taxa percentual para decimal
-    rate_decimal = rate / 100
-    
-    # Definir o número de períodos de capitalização por ano
-    frequency_map = {
-        "annual": 1,
-        "semiannual": 2,
-        "quarterly": 4,
-        "monthly": 12,
-        "daily": 365
-    }
-    
-    if compounding_frequency not in frequency_map:
-        valid_frequencies = ", ".join(frequency_map.keys())
-        raise ValueError(f"Frequência de capitalização inválida. Deve ser uma das seguintes: {valid_frequencies}")
+    n = _FREQUENCY_MAP.get(compounding_frequency)
+    if n is None:
+        raise ValueError(_INVALID_FREQUENCY_MESSAGE)
     
-    n = frequency_map[compounding_frequency]
-    
-    # Calcular o valor futuro usando a fórmula de juros compostos
-    future_value = principal * (1 + rate_decimal / n) ** (n * time_years)
-    
-    return future_value
+    return _future_value_core(principal, rate, time_years, n)
 
 
 def calculate_inflation_adjusted_value(present_value, inflation_rate, years):
@@ -219,10 +620,49 @@ def calculate_inflation_adjusted_value(present_value, inflation_rate, years):
     if years < 0:
         raise ValueError("O número de anos não pode ser negativo")
     
-    # Converter taxa percentual para decimal
-    inflation_decimal = inflation_rate / 100
+    return _inflation_adjusted_core(present_value, inflation_rate, years)
+
+
+def generate_amortization_schedules(rates, terms, amounts):
+    """
+    Gera as tabelas de amortização de uma carteira de empréstimos em uma única chamada.
     
-    # Calcular o valor ajustado pela inflação
-    adjusted_value = present_value / ((1 + inflation_decimal) ** years)
+    Args:
+        rates (array-like): Taxas de juros anuais (em percentual, ex: 5.5 para 5.5%)
+        terms (array-like): Prazos dos empréstimos em anos
+        amounts (array-like): Valores totais dos empréstimos
+    
+    Returns:
+        tuple: Quatro matrizes (payments, principal, interest, balances) com uma linha
+               por empréstimo e uma coluna por mês, até o maior prazo da carteira.
+               Os meses além do prazo de cada empréstimo ficam zerados e os valores
+               não são arredondados. Calculados mês a mês, podem diferir da tabela
+               do LoanCalculator nos últimos dígitos; o saldo final é sempre zero.
+    
+    Raises:
+        ValueError: Se alguma taxa for negativa, algum prazo for menor ou igual a zero
+                    ou algum valor de empréstimo for menor ou igual a zero
+    """
+    rates, terms, amounts = np.broadcast_arrays(
+        np.asarray(rates, dtype=np.float64),
+        np.asarray(terms, dtype=np.int64),
+        np.asarray(amounts, dtype=np.float64)
+    )
+    
+    if np.any(rates < 0):
+        raise ValueError("A taxa de juros não pode ser negativa")
+    if np.any(terms <= 0):
+        raise ValueError("O prazo do empréstimo deve ser maior que zero")
+    if np.any(amounts <= 0):
+        raise ValueError("O valor do empréstimo deve ser maior que zero")
+    
+    monthly_rates = rates / 100 / 12
+    months = terms * 12
+    
+    shape = rates.shape + (int(months.max(initial=0)),)
+    columns = tuple(np.empty(shape) for _ in range(4))
+    rows = tuple(column.reshape(rates.size, shape[-1]) for column in columns)
+    
+    _amortize_batch_kernel(monthly_rates.ravel(), months.ravel(), amounts.ravel(), *rows)
     
-    return adjusted_value
\ No newline at end of file
+    return columns
\ No newline at end of file
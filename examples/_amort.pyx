@@ -0,0 +1,60 @@
+# _amort.pyx
+# Kernel em C da tabela de amortização, para ambientes sem Numba
+#
+# Compilação (gera _amort.*.so ao lado deste arquivo):
+#     cythonize -i _amort.pyx
+#
+# -ffast-math não é usado de propósito: ele permite ao compilador eliminar
+# a soma compensada (Kahan) do saldo devedor.
+#
+# distutils: extra_compile_args = -O3 -march=native
+# cython: boundscheck=False, wraparound=False, cdivision=True, language_level=3
+
+
+def amortize(double rate, long n, double loan, double payment,
+             double[::1] out_payment, double[::1] out_principal,
+             double[::1] out_interest, double[::1] out_balance):
+    """
+    Preenche as colunas da tabela de amortização de um único empréstimo.
+
+    Mesmo contrato de _amortize_kernel em FinancialCalculator.py: o saldo
+    devedor é atualizado com soma compensada (Kahan), o saldo final é
+    fixado em zero e as posições além de n nas saídas são zeradas.
+
+    Args:
+        rate (float): Taxa de juros mensal (decimal)
+        n (int): Número de parcelas
+        loan (float): Valor do empréstimo
+        payment (float): Valor da parcela mensal
+        out_payment, out_principal, out_interest, out_balance (ndarray): Colunas de saída
+    """
+    cdef Py_ssize_t k
+    cdef Py_ssize_t size = out_balance.shape[0]
+    cdef double balance = loan
+    cdef double compensation = 0.0
+    cdef double interest, principal, y, t
+
+    with nogil:
+        for k in range(size):
+            if k >= n:
+                out_payment[k] = 0.0
+                out_principal[k] = 0.0
+                out_interest[k] = 0.0
+                out_balance[k] = 0.0
+                continue
+
+            interest = balance * rate
+            principal = payment - interest
+
+            y = -principal - compensation
+            t = balance + y
+            compensation = (t - balance) - y
+            balance = t
+
+            if k == n - 1:
+                balance = 0.0
+
+            out_payment[k] = payment
+            out_principal[k] = principal
+            out_interest[k] = interest
+            out_balance[k] = balance
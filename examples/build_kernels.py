@@ -0,0 +1,45 @@
+# build_kernels.py
+# Compila antecipadamente (AOT) os kernels do FinancialCalculator.py com numba.pycc
+#
+# Gera o módulo de extensão _finance_kernels ao lado deste arquivo. Com ele,
+# o FinancialCalculator.py usa kernels nativos mesmo sem o Numba instalado
+# e sem custo de compilação na primeira chamada. O Numba só é necessário
+# para rodar este script.
+#
+# Uso:
+#     python build_kernels.py
+
+import os
+
+from numba.pycc import CC
+
+from FinancialCalculator import (
+    _amortize_kernel,
+    _pmt_batch_kernel,
+    _pmt_from_growth_jit,
+    _pmt_kernel,
+    _schedule_columns_jit,
+)
+
+
+def build(output_dir=None):
+    """
+    Compila o módulo _finance_kernels.
+
+    Args:
+        output_dir (str): Diretório de saída (padrão: diretório deste arquivo)
+    """
+    cc = CC('_finance_kernels')
+    cc.output_dir = output_dir or os.path.dirname(os.path.abspath(__file__))
+
+    cc.export('pmt', 'f8(f8, i8, f8)')(_pmt_kernel.py_func)
+    cc.export('pmt_from_growth', 'f8(f8, i8, f8, f8)')(_pmt_from_growth_jit.py_func)
+    cc.export('pmt_batch', 'f8[:](f8[:], i8[:], f8[:])')(_pmt_batch_kernel.py_func)
+    cc.export('schedule_columns', 'Tuple((f8[:], f8[:], f8[:]))(f8, i8, f8, f8, f8)')(_schedule_columns_jit.py_func)
+    cc.export('amortize', 'void(f8, i8, f8, f8, f8[:], f8[:], f8[:], f8[:])')(_amortize_kernel.py_func)
+
+    cc.compile()
+
+
+if __name__ == '__main__':
+    build()